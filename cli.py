@@ -4,11 +4,18 @@ import argparse
 import json
 import random
 from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export
+    orjson = None
 
 from hexflower.generators import (
     ConnectedHexflowerBuilder,
     SnowflakeHexflowerGenerator,
     ConcentricHexflowerOfHexflowersBuilder,
+    iter_snowflake_records,
 )
 
 from hexflower.render_svg import PointyTopLayout, SVGRenderer
@@ -32,18 +39,56 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Number of concentric rings of snowflakes (1->7, 2->19, 3->37 ...). If set, overrides --count.",
     )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --meta-radius >= 2 (output does not depend on this).",
+    )
 
     return ap.parse_args()
 
 
+def dumps_json(payload: object) -> bytes:
+    """Indented JSON as UTF-8 bytes; uses orjson when installed (same output)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def write_json_records(path: Path, records: Iterable[Tuple[int, int, str]]) -> None:
+    """
+    Stream (q, r, value) records to `path` as they are produced, in the same
+    indented layout as dumps_json(), without building the payload list.
+    """
+    encoded: Dict[str, bytes] = {}  # values repeat; encode each one once
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as fp:
+        sep = b"[\n"
+        for q, r, v in records:
+            ev = encoded.get(v)
+            if ev is None:
+                ev = encoded[v] = dumps_json(v)
+            fp.write(b'%s  {\n    "q": %d,\n    "r": %d,\n    "value": %s\n  }' % (sep, q, r, ev))
+            sep = b",\n"
+        fp.write(b"[]" if sep == b"[\n" else b"\n]")
+
+
 def main() -> None:
     args = parse_args()
     rng = random.Random(args.seed)
 
+    if args.meta_radius is not None and args.json and not args.svg:
+        # JSON-only concentric map: stream records to the file while generating,
+        # in generation order, without an intermediate HexGrid
+        records = iter_snowflake_records(rng, args.meta_radius, args.radius, workers=args.workers)
+        write_json_records(Path(args.json), records)
+        return
+
     # Generation
     if getattr(args, "meta_radius", None) is not None:
         # Symmetric concentric "hexflower of hexflowers"
-        builder = ConcentricHexflowerOfHexflowersBuilder(rng)
+        builder = ConcentricHexflowerOfHexflowersBuilder(rng, workers=args.workers)
         grid = builder.build(meta_radius=args.meta_radius, snowflake_radius=args.radius)
     elif args.count == 1:
         # Single snowflake
@@ -59,7 +104,7 @@ def main() -> None:
         payload = grid.to_jsonable_list()
         json_path = Path(args.json)
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        json_path.write_bytes(dumps_json(payload))
 
     # SVG output
     if args.svg:
@@ -84,7 +129,7 @@ def main() -> None:
 
     # Default: print JSON to stdout
     if not args.json and not args.svg:
-        print(json.dumps(grid.to_jsonable_list(), indent=2))
+        print(dumps_json(grid.to_jsonable_list()).decode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+"""
+Packed-key hex primitives used on the hot paths (grid storage, frontier,
+snowflake plans).
+
+A hex (q, r) is packed into one int, r * 2**32 + q. Keys add like vectors, so
+neighbors and translations are single integer additions.
+
+Plain Python on purpose: the module also compiles as-is with Cython's pure
+Python mode (`cythonize -i hexflower/_hexops.py`), and an extension module
+built next to this file is picked up by the import system ahead of the .py.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+
+def pack(q: int, r: int) -> int:
+    """
+    Pack axial (q, r) into a single int: r * 2**32 + q.
+    Keys add like vectors, so pack(q1, r1) + pack(q2, r2) == pack(q1 + q2, r1 + r2),
+    and sorting keys orders hexes by (r, q), for coordinates within +/- 2**31.
+    """
+    return (r << 32) + q
+
+
+def unpack(key: int) -> Tuple[int, int]:
+    """Inverse of pack(): returns (q, r)."""
+    q = ((key + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    return q, (key - q) >> 32
+
+
+# Packed direction offsets, same order as Hex.DIRS
+DIRS_PACKED: Tuple[int, ...] = (
+    pack(1, 0),    # E
+    pack(1, -1),   # NE
+    pack(0, -1),   # NW
+    pack(-1, 0),   # W
+    pack(-1, 1),   # SW
+    pack(0, 1),    # SE
+)
+
+
+def packed_neighbors(key: int) -> Tuple[int, ...]:
+    """The six neighbor keys, in Hex.DIRS order."""
+    e, ne, nw, w, sw, se = DIRS_PACKED
+    return (key + e, key + ne, key + nw, key + w, key + sw, key + se)
+
+
+@lru_cache(maxsize=None)
+def ring_offsets(radius: int) -> Tuple[int, ...]:
+    """Center-relative packed keys of ring `radius`, in HexTraversal.ring order."""
+    if radius < 0:
+        raise ValueError("radius must be >= 0")
+    if radius == 0:
+        return (0,)
+
+    # Start at SW * radius (DIR index 4)
+    k = DIRS_PACKED[4] * radius
+    out = []
+    for side in range(6):
+        d = DIRS_PACKED[side]
+        for _ in range(radius):
+            out.append(k)
+            k += d
+    return tuple(out)
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import random
-from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from ._hexops import pack, unpack
 from .grid import HexGrid
 from .hex import Hex
-from .tables import BiomeTables
+from .tables import BIOMES, BiomeTables
 from .traversal import HexTraversal
 
 Biome = str
 
 
+def _sign(x: int) -> int:
+    return (x > 0) - (x < 0)
+
+
+# (sign(dq), sign(dr), sign(ds)) of target - center -> indices of Hex.DIRS that
+# reduce the distance to center. A step does so iff the cube component it
+# increments is negative and the one it decrements is positive.
+_INWARD_DIRS: Dict[Tuple[int, int, int], Tuple[int, ...]] = {
+    signs: tuple(
+        i
+        for i, (a, b) in enumerate(Hex.DIRS)
+        if all(c == 0 or s == -c for c, s in zip((a, b, -a - b), signs))
+    )
+    for signs in product((-1, 0, 1), repeat=3)
+}
+
+
 class SnowflakeHexflowerGenerator:
     """
     Generates a "snowflake" cluster ring-by-ring using an inward-neighbor
@@ -28,15 +49,15 @@ class SnowflakeHexflowerGenerator:
         Prefer an already-generated neighbor that is exactly one step closer to center.
         Fallback to any already-generated neighbor.
         """
-        dist_target = target.distance(center)
-
-        inward_candidates: List[Hex] = []
-        for nb in target.neighbors():
-            if nb in grid and nb.distance(center) == dist_target - 1:
-                inward_candidates.append(nb)
+        dq = target.q - center.q
+        dr = target.r - center.r
+        ds = -dq - dr
 
-        if inward_candidates:
-            return inward_candidates[0]  # deterministic choice
+        # The 1-2 directions that step closer to center, in DIRS order
+        for i in _INWARD_DIRS[(_sign(dq), _sign(dr), _sign(ds))]:
+            nb = target.neighbor(i)
+            if nb in grid:
+                return nb  # deterministic choice
 
         for nb in target.neighbors():
             if nb in grid:
@@ -48,23 +69,55 @@ class SnowflakeHexflowerGenerator:
         if radius < 0:
             raise ValueError("radius must be >= 0")
 
-        grid = HexGrid()
+        offsets, parents = _snowflake_plan(radius)
+
+        # Center ALWAYS included; every ring hex's roll is drawn up front in one RNG call
+        start = BiomeTables.start_biome_id(self.rng)
+        rolls = BiomeTables.next_rolls(self.rng, len(offsets) - 1)
+
+        biome_ids = _fill_biomes(start, rolls, parents)
+        center_key = pack(center.q, center.r)
+        return HexGrid.from_packed(zip([center_key + off for off in offsets], biome_ids))
+
 
-        # Center ALWAYS included
-        grid.set(center, BiomeTables.start_biome(self.rng))
+@lru_cache(maxsize=None)
+def _snowflake_plan(radius: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Ring-by-ring generation order of a snowflake as center-relative packed keys,
+    plus the index of each hex's inward neighbor within that order (-1 for the center).
+
+    The inward neighbor depends only on geometry (all inner rings are complete
+    when a ring is filled), so it is resolved once per radius.
+    """
+    center = Hex(0, 0)
+    grid = HexGrid()
+    index: Dict[int, int] = {}
+    offsets: List[int] = []
+    parents: List[int] = []
+
+    for dq, dr in HexTraversal.spiral_offsets(radius):
+        h = Hex(dq, dr)
+        prev_hex = SnowflakeHexflowerGenerator._choose_inward_neighbor(h, center, grid)
+        parents.append(-1 if prev_hex is None else index[prev_hex.key])
+        index[h.key] = len(offsets)
+        offsets.append(h.key)
+        grid.set(h, BIOMES[0])  # placeholder; only membership matters
+
+    return tuple(offsets), tuple(parents)
 
-        # Ring-by-ring fill
-        for r in range(1, radius + 1):
-            for h in HexTraversal.ring(center, r):
-                prev_hex = self._choose_inward_neighbor(h, center, grid)
-                if prev_hex is None:
-                    # Defensive fallback; should not happen after center is set
-                    grid.set(h, BiomeTables.start_biome(self.rng))
-                else:
-                    prev_biome = grid.get(prev_hex) or "grassland"
-                    grid.set(h, BiomeTables.next_biome(prev_biome, self.rng))
 
-        return grid
+def _fill_biomes(start: int, rolls: List[Optional[int]], parents: Tuple[int, ...]) -> List[int]:
+    """Resolve biome-id rolls against each hex's inward neighbor; ids[i] matches parents[i]."""
+    ids = [start]
+    append = ids.append
+    for parent, roll in zip(parents[1:], rolls):
+        append(ids[parent] if roll is None else roll)
+    return ids
+
+
+def _translated_keys(keys: Iterable[int], offset: int) -> Iterator[int]:
+    """Packed keys shifted by a packed offset, generated lazily so set checks can stop early."""
+    return map(offset.__add__, keys)
 
 
 class ConnectedHexflowerBuilder:
@@ -87,42 +140,35 @@ class ConnectedHexflowerBuilder:
         super_map = HexGrid()
         super_map.update(gen.generate(center=Hex(0, 0), radius=radius))
 
+        # Both are live and maintained by super_map.update(), so each placement
+        # only pays for the cells it adds.
+        super_keys = super_map.packed_keys()
+        frontier = super_map.frontier()
+
         for _ in range(count - 1):
             new = gen.generate(center=Hex(0, 0), radius=radius)
-
-            super_keys = list(super_map.keys())
-            new_keys = list(new.keys())
-
-            # Precompute frontier targets: empty neighbors adjacent to super_map
-            super_set = set(super_map.keys())
-            frontier: list[Hex] = []
-            for h in super_set:
-                for nb in h.neighbors():
-                    if nb not in super_set:
-                        frontier.append(nb)
+            new_keys = list(new.packed_keys())
 
             if not frontier:
                 raise RuntimeError("No frontier found; super_map unexpectedly has no empty adjacent hexes.")
+            targets = list(frontier)
 
             placed = False
             for _try in range(max_tries):
-                target = self.rng.choice(frontier)  # empty hex adjacent to super_map
+                target = self.rng.choice(targets)  # empty hex adjacent to super_map
                 anchor = self.rng.choice(new_keys)  # hex in the new snowflake we will align to target
 
-                dq = target.q - anchor.q
-                dr = target.r - anchor.r
+                offset = target - anchor
 
-                moved = new.translate(dq, dr)
-
-                # overlap check
-                if not super_map.is_disjoint(moved):
+                # overlap check (lazy: no translated grid is built for rejected tries)
+                if not super_keys.isdisjoint(_translated_keys(new_keys, offset)):
                     continue
 
                 # touching check: guaranteed in most cases, but keep it strict
-                if not super_map.touches(moved):
+                if frontier.isdisjoint(_translated_keys(new_keys, offset)):
                     continue
 
-                super_map.update(moved)
+                super_map.update(new.translate(*unpack(offset)))
                 placed = True
                 break
 
@@ -134,6 +180,16 @@ class ConnectedHexflowerBuilder:
 
         return super_map
 
+
+def _gen_one(center_q: int, center_r: int, radius: int, seed: int) -> List[Tuple[int, int]]:
+    """
+    Generate one snowflake from its own seed as (packed key, biome id) pairs,
+    which pickle cheaply. Biome ids are the same in every process.
+    """
+    gen = SnowflakeHexflowerGenerator(random.Random(seed))
+    return list(gen.generate(center=Hex(center_q, center_r), radius=radius).packed_items())
+
+
 class ConcentricHexflowerOfHexflowersBuilder:
     """
     Builds a symmetric 'hexflower of hexflowers' by placing snowflake-centers on a meta-hexflower.
@@ -144,12 +200,27 @@ class ConcentricHexflowerOfHexflowersBuilder:
     Spacing S = 2*snowflake_radius + 1 ensures:
       - no overlap between snowflake disks
       - edge-adjacent touching between neighboring snowflakes
+
+    Each snowflake is generated from its own seed drawn from `rng`, so the result
+    is the same for any `workers`. With workers > 1 and meta_radius >= 2 the
+    snowflakes are generated in a process pool.
     """
 
-    def __init__(self, rng: random.Random) -> None:
+    def __init__(self, rng: random.Random, workers: int = 1) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
         self.rng = rng
+        self.workers = workers
 
     def build(self, meta_radius: int, snowflake_radius: int) -> HexGrid:
+        return HexGrid.from_packed(self.iter_cells(meta_radius, snowflake_radius))
+
+    def iter_cells(self, meta_radius: int, snowflake_radius: int) -> Iterator[Tuple[int, int]]:
+        """
+        (packed key, biome id) of every merged cell, in generation order, without building a grid.
+        Arguments are validated and seeds drawn immediately; snowflakes are generated
+        as the iterator is consumed.
+        """
         if meta_radius < 0:
             raise ValueError("meta_radius must be >= 0")
         if snowflake_radius < 0:
@@ -158,20 +229,54 @@ class ConcentricHexflowerOfHexflowersBuilder:
         # Overlapping spacing to remove visible gaps and create stitched edges
         spacing = 2 * snowflake_radius  # for R=2 => 4
 
-        gen = SnowflakeHexflowerGenerator(self.rng)
-        out = HexGrid()
-
-        meta_center = Hex(0, 0)
-        meta_positions = HexTraversal.spiral(meta_center, meta_radius)
-
-        for mh in meta_positions:
-            center = Hex(mh.q * spacing, mh.r * spacing)
-            snowflake = gen.generate(center=center, radius=snowflake_radius)
-
-            # Merge policy: FIRST WINS (do not overwrite existing cells)
-            for h, v in snowflake.items():
-                if out.get(h) is None:
-                    out.set(h, v)
-
-        return out
+        meta_positions = HexTraversal.spiral_offsets(meta_radius)
+        center_qs = [mq * spacing for mq, _ in meta_positions]
+        center_rs = [mr * spacing for _, mr in meta_positions]
+        radii = [snowflake_radius] * len(meta_positions)
+        seeds = [self.rng.getrandbits(64) for _ in meta_positions]
+
+        parallel = self.workers > 1 and meta_radius >= 2
+        return self._iter_merged(center_qs, center_rs, radii, seeds, parallel)
+
+    def _iter_merged(
+        self,
+        center_qs: List[int],
+        center_rs: List[int],
+        radii: List[int],
+        seeds: List[int],
+        parallel: bool,
+    ) -> Iterator[Tuple[int, int]]:
+        if parallel:
+            chunksize = max(1, len(seeds) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                yield from self._first_wins(
+                    pool.map(_gen_one, center_qs, center_rs, radii, seeds, chunksize=chunksize)
+                )
+        else:
+            yield from self._first_wins(map(_gen_one, center_qs, center_rs, radii, seeds))
 
+    @staticmethod
+    def _first_wins(snowflakes: Iterable[List[Tuple[int, int]]]) -> Iterator[Tuple[int, int]]:
+        # Merge policy: FIRST WINS (do not overwrite existing cells), in meta-spiral order
+        seen: Set[int] = set()
+        add = seen.add
+        for snowflake in snowflakes:
+            for k, v in snowflake:
+                if k not in seen:
+                    add(k)
+                    yield k, v
+
+
+def iter_snowflake_records(
+    rng: random.Random,
+    meta_radius: int,
+    snowflake_radius: int,
+    workers: int = 1,
+) -> Iterator[Tuple[int, int, Biome]]:
+    """
+    (q, r, biome) records of a concentric hexflower-of-hexflowers, streamed in
+    generation order. Same cells as ConcentricHexflowerOfHexflowersBuilder.build().
+    """
+    builder = ConcentricHexflowerOfHexflowersBuilder(rng, workers=workers)
+    cells = builder.iter_cells(meta_radius, snowflake_radius)
+    return ((*unpack(k), BIOMES[vid]) for k, vid in cells)
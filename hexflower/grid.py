@@ -1,76 +1,238 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Tuple
+from array import array
+from collections.abc import Set as AbstractSetBase
+from typing import AbstractSet, Dict, ItemsView, Iterable, Iterator, KeysView, List, Optional, Tuple
 
+from ._hexops import pack, packed_neighbors, unpack
 from .hex import Hex
+from .tables import BIOME_IDS, BIOMES
 
 Biome = str
 
+# Cells hold a biome id (index into tables.BIOMES) rather than the biome string.
+# Any other payload is kept unchanged in HexGrid._raw and marked with RAW_ID.
+RAW_ID = 255
+
+
+def _biome_id(value: object) -> Optional[int]:
+    """Biome id of `value`, or None if it is not one of the biome strings."""
+    return BIOME_IDS.get(value) if isinstance(value, str) else None
+
+
+class _HexKeysView(AbstractSetBase):
+    """Live, reusable, set-like view of a grid's cells as Hex objects (like dict.keys())."""
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: "HexGrid") -> None:
+        self._grid = grid
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable) -> set:
+        return set(it)
+
+    def __len__(self) -> int:
+        return len(self._grid._cells)
+
+    def __iter__(self) -> Iterator[Hex]:
+        return (Hex(*unpack(k)) for k in self._grid._cells)
+
+    def __contains__(self, h: object) -> bool:
+        return h in self._grid
+
+
+class _HexItemsView(AbstractSetBase):
+    """Live, reusable, set-like view of a grid's (Hex, value) pairs (like dict.items())."""
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: "HexGrid") -> None:
+        self._grid = grid
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable) -> set:
+        return set(it)
+
+    def __len__(self) -> int:
+        return len(self._grid._cells)
+
+    def __iter__(self) -> Iterator[Tuple[Hex, Biome]]:
+        grid = self._grid
+        return ((Hex(*unpack(k)), grid._decode(k, v)) for k, v in grid._cells.items())
+
+    def __contains__(self, item: object) -> bool:
+        if not (isinstance(item, tuple) and len(item) == 2):
+            return False
+        h, value = item
+        if h not in self._grid:
+            return False
+        v = self._grid.get(h)
+        return v is value or v == value
+
 
 class HexGrid:
-    """Sparse hex grid mapping Hex -> Biome (or any payload)."""
+    """
+    Sparse hex grid mapping Hex -> Biome (or any payload).
+
+    Cells are keyed by packed ints (see _hexops.pack). Biomes are stored as one-byte
+    ids (see tables.BIOMES); other payloads are stored as-is. Hex objects and
+    biome strings are only materialized at the API boundary (items(), keys(),
+    get(), iter_sorted()).
+    """
 
     def __init__(self) -> None:
-        self._cells: Dict[Hex, Biome] = {}
+        self._cells: Dict[int, int] = {}
+        # Non-biome payloads, for the cells whose id is RAW_ID
+        self._raw: Dict[int, object] = {}
+        # Packed keys of empty hexes adjacent to the grid, as an insertion-ordered set
+        # (values unused); None until frontier() is first called
+        self._frontier: Optional[Dict[int, None]] = None
+        # Parallel (qs, rs, value ids) columns in (r, q) order; None until columns() is called
+        self._columns: Optional[Tuple[array, array, array]] = None
+
+    @classmethod
+    def from_packed(cls, items: Iterable[Tuple[int, int]]) -> "HexGrid":
+        """Build a grid directly from (packed key, biome id) pairs."""
+        out = cls()
+        out._cells = dict(items)
+        return out
 
     def __len__(self) -> int:
         return len(self._cells)
 
-    def __contains__(self, h: Hex) -> bool:
-        return h in self._cells
+    def __contains__(self, h: object) -> bool:
+        if not isinstance(h, Hex):
+            return False
+        return pack(h.q, h.r) in self._cells
 
-    def items(self) -> Iterable[Tuple[Hex, Biome]]:
-        return self._cells.items()
+    def items(self) -> AbstractSet[Tuple[Hex, Biome]]:
+        return _HexItemsView(self)
+
+    def keys(self) -> AbstractSet[Hex]:
+        return _HexKeysView(self)
 
-    def keys(self) -> Iterable[Hex]:
+    def packed_keys(self) -> KeysView[int]:
+        """Live view of the packed cell keys."""
         return self._cells.keys()
 
+    def packed_items(self) -> ItemsView[int, int]:
+        """Live view of (packed key, biome id) pairs; RAW_ID marks a non-biome payload."""
+        return self._cells.items()
+
     def get(self, h: Hex) -> Optional[Biome]:
-        return self._cells.get(h)
+        k = pack(h.q, h.r)
+        vid = self._cells.get(k)
+        return None if vid is None else self._decode(k, vid)
+
+    def value_at(self, q: int, r: int) -> Optional[Biome]:
+        """get() for raw axial coordinates."""
+        k = pack(q, r)
+        vid = self._cells.get(k)
+        return None if vid is None else self._decode(k, vid)
 
     def set(self, h: Hex, value: Biome) -> None:
-        self._cells[h] = value
+        k = pack(h.q, h.r)
+        vid = _biome_id(value)
+        if vid is None:
+            self._cells[k] = RAW_ID
+            self._raw[k] = value
+        else:
+            self._cells[k] = vid
+            self._raw.pop(k, None)
+        self._columns = None
+        if self._frontier is not None:
+            self._grow_frontier((k,))
 
     def update(self, other: "HexGrid") -> None:
+        if self._raw:
+            for k in other._cells.keys() - other._raw.keys():
+                self._raw.pop(k, None)
         self._cells.update(other._cells)
+        self._raw.update(other._raw)
+        self._columns = None
+        if self._frontier is not None:
+            self._grow_frontier(other._cells)
+
+    def frontier(self) -> KeysView[int]:
+        """
+        Packed keys of empty hexes edge-adjacent to the grid, as a live set-like view.
+        Built on first call, then kept up to date incrementally by set()/update().
+        Iteration order follows insertion (not hash layout), so seeded runs that
+        draw from it are reproducible.
+        """
+        if self._frontier is None:
+            cells = self._cells
+            self._frontier = dict.fromkeys(nb for k in cells for nb in packed_neighbors(k) if nb not in cells)
+        return self._frontier.keys()
+
+    def _grow_frontier(self, added: Iterable[int]) -> None:
+        """Account for newly added keys (already present in _cells)."""
+        cells = self._cells
+        frontier = self._frontier
+        for k in added:
+            frontier.pop(k, None)
+            for nb in packed_neighbors(k):
+                if nb not in cells:
+                    frontier[nb] = None
 
     def is_disjoint(self, other: "HexGrid") -> bool:
-        return set(self._cells.keys()).isdisjoint(other._cells.keys())
+        return self._cells.keys().isdisjoint(other._cells)
 
     def touches(self, other: "HexGrid") -> bool:
         """True if any hex in self is edge-adjacent to any hex in other."""
-        other_keys = set(other._cells.keys())
-        for h in self._cells.keys():
-            for nb in h.neighbors():
-                if nb in other_keys:
-                    return True
-        return False
+        small, large = self._cells, other._cells
+        if len(small) > len(large):
+            # Adjacency is symmetric: walk the smaller grid, probe the larger
+            small, large = large, small
+        return any(nb in large for k in small for nb in packed_neighbors(k))
 
     def translate(self, dq: int, dr: int) -> "HexGrid":
+        offset = pack(dq, dr)
         out = HexGrid()
-        for h, v in self._cells.items():
-            out.set(h.add(dq, dr), v)
+        out._cells = {k + offset: v for k, v in self._cells.items()}
+        out._raw = {k + offset: v for k, v in self._raw.items()}
         return out
 
+    def _decode(self, k: int, vid: int) -> Biome:
+        return self._raw[k] if vid == RAW_ID else BIOMES[vid]
+
     def bbox_pixels(self, layout: "PointyTopLayout") -> Tuple[float, float, float, float]:
         """
         Returns (min_x, max_x, min_y, max_y) of hex centers in pixel space.
-        Layout is duck-typed: needs layout.axial_to_pixel(Hex) -> (x, y).
+        Layout is duck-typed: needs layout.center_bounds(qs, rs) -> (min_x, max_x, min_y, max_y).
         """
         if not self._cells:
             return (0.0, 0.0, 0.0, 0.0)
 
-        xs: List[float] = []
-        ys: List[float] = []
-        for h in self._cells.keys():
-            x, y = layout.axial_to_pixel(h)
-            xs.append(x)
-            ys.append(y)
-        return (min(xs), max(xs), min(ys), max(ys))
+        qs, rs, _ = self.columns()
+        return layout.center_bounds(qs, rs)
+
+    def columns(self) -> Tuple[array, array, array]:
+        """
+        Parallel (qs, rs, biome ids) columns of all cells, ordered by (r, q).
+        Built from the sorted packed keys on first use and cached until the grid
+        changes; treat them as read-only. Ids index tables.BIOMES; RAW_ID cells
+        hold another payload, available through value_at(q, r).
+        """
+        if self._columns is None:
+            keys = sorted(self._cells)
+            qs = array("q", [((k + 0x80000000) & 0xFFFFFFFF) - 0x80000000 for k in keys])
+            rs = array("q", [(k - q) >> 32 for k, q in zip(keys, qs)])
+            vids = array("B", [self._cells[k] for k in keys])
+            self._columns = (qs, rs, vids)
+        return self._columns
+
+    def iter_sorted(self) -> Iterator[Tuple[int, int, Biome]]:
+        """(q, r, value) for every cell, ordered by (r, q)."""
+        qs, rs, vids = self.columns()
+        if not self._raw:
+            return zip(qs, rs, map(BIOMES.__getitem__, vids))
+        return (
+            (q, r, self._raw[pack(q, r)] if vid == RAW_ID else BIOMES[vid])
+            for q, r, vid in zip(qs, rs, vids)
+        )
 
     def to_jsonable_list(self) -> List[dict]:
         """Stable, human-readable JSON structure."""
-        out: List[dict] = []
-        for h, v in sorted(self._cells.items(), key=lambda kv: (kv[0].r, kv[0].q)):
-            out.append({"q": h.q, "r": h.r, "value": v})
-        return out
\ No newline at end of file
+        return [{"q": q, "r": r, "value": v} for q, r, v in self.iter_sorted()]
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import FrozenInstanceError
+from typing import ClassVar, List, Tuple
+
+from ._hexops import pack, unpack
 
 
-@dataclass(frozen=True, slots=True, order=True)
 class Hex:
-    """Axial hex coordinate (q, r), pointy-top orientation."""
+    """
+    Axial hex coordinate (q, r), pointy-top orientation.
+
+    Immutable and hashable. Hand-written rather than a frozen dataclass so the
+    hash is computed once at construction and equality is a plain field compare.
+    """
+
+    __slots__ = ("q", "r", "_h")
+    __match_args__ = ("q", "r")
+
     q: int
     r: int
 
     # Axial direction vectors (pointy-top)
-    DIRS: Tuple[Tuple[int, int], ...] = (
+    DIRS: ClassVar[Tuple[Tuple[int, int], ...]] = (
         (1, 0),    # E
         (1, -1),   # NE
         (0, -1),   # NW
@@ -20,6 +30,51 @@ class Hex:
         (0, 1),    # SE
     )
 
+    def __init__(self, q: int, r: int) -> None:
+        object.__setattr__(self, "q", q)
+        object.__setattr__(self, "r", r)
+        object.__setattr__(self, "_h", hash((q, r)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self):
+        return self.__class__, (self.q, self.r)
+
+    def __hash__(self) -> int:
+        return self._h
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.q == other.q and self.r == other.r
+        return NotImplemented
+
+    def __lt__(self, other: "Hex") -> bool:
+        if other.__class__ is self.__class__:
+            return (self.q, self.r) < (other.q, other.r)
+        return NotImplemented
+
+    def __le__(self, other: "Hex") -> bool:
+        if other.__class__ is self.__class__:
+            return (self.q, self.r) <= (other.q, other.r)
+        return NotImplemented
+
+    def __gt__(self, other: "Hex") -> bool:
+        if other.__class__ is self.__class__:
+            return (self.q, self.r) > (other.q, other.r)
+        return NotImplemented
+
+    def __ge__(self, other: "Hex") -> bool:
+        if other.__class__ is self.__class__:
+            return (self.q, self.r) >= (other.q, other.r)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Hex(q={self.q!r}, r={self.r!r})"
+
     def neighbor(self, direction_index: int) -> "Hex":
         dq, dr = self.DIRS[direction_index]
         return Hex(self.q + dq, self.r + dr)
@@ -43,5 +98,14 @@ class Hex:
         dr = self.r - other.r
         return max(abs(dq), abs(dr), abs((self.q + self.r) - (other.q + other.r)))
 
+    @property
+    def key(self) -> int:
+        """Packed int key of this coordinate (see pack())."""
+        return pack(self.q, self.r)
+
+    @staticmethod
+    def from_key(key: int) -> "Hex":
+        return Hex(*unpack(key))
+
     def __str__(self) -> str:
         return f"({self.q},{self.r})"
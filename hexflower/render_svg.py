@@ -1,32 +1,61 @@
 from __future__ import annotations
 
+import io
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
 
-from .grid import HexGrid
+from .grid import RAW_ID, HexGrid
 from .hex import Hex
+from .tables import BIOMES
 
 Biome = str
 
+_SQRT3 = math.sqrt(3.0)
+# Pointy-top corner directions: 60*i - 30 degrees
+_CORNER_ANGLES = tuple(math.radians(60 * i - 30) for i in range(6))
+_CORNER_COS = tuple(math.cos(a) for a in _CORNER_ANGLES)
+_CORNER_SIN = tuple(math.sin(a) for a in _CORNER_ANGLES)
+
 
 @dataclass(frozen=True, slots=True)
 class PointyTopLayout:
     """Axial -> pixel conversion for pointy-top hexes."""
     size: float  # hex radius in px
 
+    # Corner offsets from a hex center; identical for every hex of this layout
+    _cdx: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _cdy: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_cdx", tuple(self.size * c for c in _CORNER_COS))
+        object.__setattr__(self, "_cdy", tuple(self.size * s for s in _CORNER_SIN))
+
     def axial_to_pixel(self, h: Hex) -> Tuple[float, float]:
-        x = self.size * math.sqrt(3) * (h.q + h.r / 2)
+        x = self.size * _SQRT3 * (h.q + h.r * 0.5)
         y = self.size * 1.5 * h.r
         return x, y
 
     def hex_corners(self, cx: float, cy: float) -> List[Tuple[float, float]]:
-        pts: List[Tuple[float, float]] = []
-        for i in range(6):
-            angle = math.radians(60 * i - 30)  # pointy-top
-            pts.append((cx + self.size * math.cos(angle), cy + self.size * math.sin(angle)))
-        return pts
+        return [(cx + dx, cy + dy) for dx, dy in zip(self._cdx, self._cdy)]
+
+    def centers(self, qs: Sequence[int], rs: Sequence[int]) -> List[Tuple[float, float]]:
+        """axial_to_pixel over parallel q/r sequences."""
+        sx = self.size * _SQRT3
+        sy = self.size * 1.5
+        return [(sx * (q + r * 0.5), sy * r) for q, r in zip(qs, rs)]
+
+    def center_bounds(self, qs: Sequence[int], rs: Sequence[int]) -> Tuple[float, float, float, float]:
+        """
+        (min_x, max_x, min_y, max_y) of the hex centers given as parallel q/r sequences.
+        x is linear in (2q + r) and y in r, so the extremes follow from integer
+        min/max alone, without converting every hex to pixels.
+        """
+        xs2 = [2 * q + r for q, r in zip(qs, rs)]
+        kx = self.size * _SQRT3 * 0.5
+        ky = self.size * 1.5
+        return (kx * min(xs2), kx * max(xs2), ky * min(rs), ky * max(rs))
 
 
 class SVGRenderer:
@@ -62,8 +91,33 @@ class SVGRenderer:
         show_biome_label: bool = True,
         padding_factor: float = 2.2,
     ) -> str:
-        if len(grid) == 0:
-            raise ValueError("Cannot render an empty grid.")
+        buf = io.StringIO()
+        self.render_to(
+            grid,
+            buf,
+            title=title,
+            show_coords=show_coords,
+            show_biome_label=show_biome_label,
+            padding_factor=padding_factor,
+        )
+        return buf.getvalue()
+
+    def render_to(
+        self,
+        grid: HexGrid,
+        fp: TextIO,
+        title: str,
+        show_coords: bool = True,
+        show_biome_label: bool = True,
+        padding_factor: float = 2.2,
+    ) -> None:
+        """
+        Write the SVG document to a text stream piece by piece. Cells are first
+        bucketed by fill as column indices; path data is then formatted and
+        written one color at a time, so only one color's strings are held in
+        memory, never the whole document.
+        """
+        self._check_renderable(grid)
 
         minx, maxx, miny, maxy = grid.bbox_pixels(self.layout)
         pad = self.layout.size * padding_factor
@@ -82,49 +136,86 @@ class SVGRenderer:
                  .replace("'", "&apos;")
             )
 
-        parts: List[str] = []
-        parts.append(
+        write = fp.write
+        write(
             f'<svg xmlns="http://www.w3.org/2000/svg" '
             f'width="{width:.0f}" height="{height:.0f}" '
-            f'viewBox="{view_minx:.0f} {view_miny:.0f} {width:.0f} {height:.0f}">'
+            f'viewBox="{view_minx:.0f} {view_miny:.0f} {width:.0f} {height:.0f}">\n'
         )
-        parts.append(
-            f'<rect x="{view_minx:.0f}" y="{view_miny:.0f}" width="{width:.0f}" height="{height:.0f}" fill="{esc(self.background)}"/>'
+        write(
+            f'<rect x="{view_minx:.0f}" y="{view_miny:.0f}" width="{width:.0f}" height="{height:.0f}" fill="{esc(self.background)}"/>\n'
         )
 
-        parts.append(
+        write(
             f'<text x="{view_minx + pad/2:.1f}" y="{view_miny + pad/2:.1f}" '
-            f'font-family="Arial" font-size="18" fill="#111">{esc(title)}</text>'
+            f'font-family="Arial" font-size="18" fill="#111">{esc(title)}</text>\n'
         )
 
-        for h, biome in sorted(grid.items(), key=lambda kv: (kv[0].r, kv[0].q)):
-            cx, cy = self.layout.axial_to_pixel(h)
-            corners = self.layout.hex_corners(cx, cy)
-            pts_str = " ".join(f"{x:.1f},{y:.1f}" for x, y in corners)
-            fill = self.palette.get(biome, "#DDDDDD")
-
-            parts.append(
-                f'<polygon points="{pts_str}" fill="{esc(fill)}" '
-                f'stroke="{esc(self.stroke)}" stroke-width="{self.stroke_width:.2f}"/>'
-            )
-
-            if show_coords:
-                parts.append(
-                    f'<text x="{cx:.1f}" y="{cy - 2:.1f}" '
-                    f'font-family="Arial" font-size="12" text-anchor="middle" fill="#111">'
-                    f'{esc(f"{h.q},{h.r}")}</text>'
-                )
-            if show_biome_label:
-                parts.append(
-                    f'<text x="{cx:.1f}" y="{cy + 16:.1f}" '
-                    f'font-family="Arial" font-size="11" text-anchor="middle" fill="#111">'
-                    f'{esc(biome)}</text>'
-                )
-
-        parts.append("</svg>")
-        return "\n".join(parts)
+        # Corner offsets are identical for every hex
+        offsets = self.layout.hex_corners(0.0, 0.0)
+        # Sub-pixel corner precision is invisible at normal hex sizes
+        fmt_pt = ("{:.0f},{:.0f}" if self.layout.size >= 20 else "{:.1f},{:.1f}").format
+
+        qs, rs, vids = grid.columns()
+        # Palette and labels keyed on biome id, resolved and escaped once per biome;
+        # non-biome payloads (RAW_ID) are looked up per cell
+        fills = {vid: esc(self.palette.get(b, "#DDDDDD")) for vid, b in enumerate(BIOMES)}
+        labels = {vid: esc(b) for vid, b in enumerate(BIOMES)}
+
+        def raw_fill(q: int, r: int) -> str:
+            v = grid.value_at(q, r)
+            return esc(self.palette.get(v, "#DDDDDD")) if isinstance(v, str) else "#DDDDDD"
+
+        def raw_label(q: int, r: int) -> str:
+            return esc(str(grid.value_at(q, r)))
+
+        # Bucket column indices by fill color (ints only; no strings yet)
+        buckets: Dict[str, List[int]] = {}
+        for i, (q, r, vid) in enumerate(zip(qs, rs, vids)):
+            fill = raw_fill(q, r) if vid == RAW_ID else fills[vid]
+            bucket = buckets.get(fill)
+            if bucket is None:
+                bucket = buckets[fill] = []
+            bucket.append(i)
+
+        # One <path> per fill color; each hex is a closed "M x,y x,y ... Z" subpath
+        # (coordinate pairs after M are implicit line-tos). Shared attributes live
+        # on the enclosing <g> instead of every element.
+        write(f'<g stroke="{esc(self.stroke)}" stroke-width="{self.stroke_width:.2f}">\n')
+        for fill, bucket in buckets.items():
+            subpaths = []
+            for cx, cy in self.layout.centers([qs[i] for i in bucket], [rs[i] for i in bucket]):
+                subpaths.append("M" + " ".join([fmt_pt(cx + dx, cy + dy) for dx, dy in offsets]) + "Z")
+            write(f'<path fill="{fill}" d="{"".join(subpaths)}"/>\n')
+            del subpaths
+        write("</g>\n")
+        del buckets
+
+        # Labels are written straight from the columns
+        if show_coords or show_biome_label:
+            centers = self.layout.centers(qs, rs)
+        if show_coords:
+            write('<g font-family="Arial" font-size="12" text-anchor="middle" fill="#111">\n')
+            for q, r, (cx, cy) in zip(qs, rs, centers):
+                write(f'<text x="{cx:.1f}" y="{cy - 2:.1f}">{esc(f"{q},{r}")}</text>\n')
+            write("</g>\n")
+        if show_biome_label:
+            write('<g font-family="Arial" font-size="11" text-anchor="middle" fill="#111">\n')
+            for q, r, vid, (cx, cy) in zip(qs, rs, vids, centers):
+                label = raw_label(q, r) if vid == RAW_ID else labels[vid]
+                write(f'<text x="{cx:.1f}" y="{cy + 16:.1f}">{label}</text>\n')
+            write("</g>\n")
+
+        write("</svg>")
 
     def write_svg(self, grid: HexGrid, path: Path, **kwargs) -> None:
-        svg = self.render(grid, **kwargs)
+        # Fail before creating or truncating the file
+        self._check_renderable(grid)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(svg, encoding="utf-8")
+        with path.open("w", encoding="utf-8") as fp:
+            self.render_to(grid, fp, **kwargs)
+
+    @staticmethod
+    def _check_renderable(grid: HexGrid) -> None:
+        if len(grid) == 0:
+            raise ValueError("Cannot render an empty grid.")
@@ -1,9 +1,33 @@
 from __future__ import annotations
 
 import random
+from typing import Dict, List, Optional, Tuple
 
 Biome = str
 
+# Canonical biome order; a biome's id is its index here
+BIOMES: Tuple[Biome, ...] = ("grassland", "forest", "hills", "marsh", "mountains")
+BIOME_IDS: Dict[Biome, int] = {b: i for i, b in enumerate(BIOMES)}
+
+# d10 tables indexed by (roll - 1). None in the next-hex table means "same as previous hex".
+_START_TABLE = (
+    "grassland", "grassland", "grassland", "grassland",
+    "forest", "forest",
+    "hills", "hills",
+    "marsh",
+    "mountains",
+)
+_NEXT_TABLE = (
+    None, None, None, None, None,
+    "grassland",
+    "forest",
+    "hills",
+    "marsh",
+    "mountains",
+)
+_START_ID_TABLE = tuple(BIOME_IDS[b] for b in _START_TABLE)
+_NEXT_ID_TABLE = tuple(None if b is None else BIOME_IDS[b] for b in _NEXT_TABLE)
+
 
 class BiomeTables:
     """
@@ -25,28 +49,22 @@ class BiomeTables:
 
     @staticmethod
     def start_biome(rng: random.Random) -> Biome:
-        x = rng.randint(1, 10)
-        if 1 <= x <= 4:
-            return "grassland"
-        if 5 <= x <= 6:
-            return "forest"
-        if 7 <= x <= 8:
-            return "hills"
-        if x == 9:
-            return "marsh"
-        return "mountains"
+        return _START_TABLE[rng.randrange(10)]
 
     @staticmethod
     def next_biome(prev: Biome, rng: random.Random) -> Biome:
-        x = rng.randint(1, 10)
-        if 1 <= x <= 5:
-            return prev
-        if x == 6:
-            return "grassland"
-        if x == 7:
-            return "forest"
-        if x == 8:
-            return "hills"
-        if x == 9:
-            return "marsh"
-        return "mountains"
+        t = _NEXT_TABLE[rng.randrange(10)]
+        return prev if t is None else t
+
+    @staticmethod
+    def start_biome_id(rng: random.Random) -> int:
+        """start_biome() as a biome id (index into BIOMES)."""
+        return _START_ID_TABLE[rng.randrange(10)]
+
+    @staticmethod
+    def next_rolls(rng: random.Random, n: int) -> List[Optional[int]]:
+        """
+        n independent next-hex rolls as biome ids, in a single RNG call.
+        None means "same as previous hex".
+        """
+        return rng.choices(_NEXT_ID_TABLE, k=n)
@@ -1,33 +1,50 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
+from ._hexops import ring_offsets, unpack
 from .hex import Hex
 
+Offset = Tuple[int, int]
+
+
+@lru_cache(maxsize=None)
+def _ring_offsets(radius: int) -> Tuple[Offset, ...]:
+    """Center-relative (dq, dr) of ring `radius`, in HexTraversal.ring order."""
+    return tuple(unpack(k) for k in ring_offsets(radius))
+
+
+@lru_cache(maxsize=None)
+def _spiral_offsets(radius: int) -> Tuple[Offset, ...]:
+    out: List[Offset] = []
+    for r in range(0, radius + 1):
+        out.extend(_ring_offsets(r))
+    return tuple(out)
+
 
 class HexTraversal:
     """Ring traversal in axial coords (pointy-top)."""
 
     @staticmethod
-    def ring(center: Hex, radius: int) -> List[Hex]:
+    def ring_offsets(radius: int) -> Tuple[Offset, ...]:
+        """Center-relative (dq, dr) offsets of ring(center, radius); cached per radius."""
         if radius < 0:
             raise ValueError("radius must be >= 0")
-        if radius == 0:
-            return [center]
-
-        # Start at SW * radius (DIR index 4)
-        h = center.scale_dir(4, radius)
-        out: List[Hex] = []
-        for side in range(6):
-            for _ in range(radius):
-                out.append(h)
-                h = h.neighbor(side)
-        return out
+        return _ring_offsets(radius)
+
+    @staticmethod
+    def spiral_offsets(radius: int) -> Tuple[Offset, ...]:
+        """Center-relative (dq, dr) offsets of spiral(center, radius); cached per radius."""
+        if radius < 0:
+            raise ValueError("radius must be >= 0")
+        return _spiral_offsets(radius)
+
+    @staticmethod
+    def ring(center: Hex, radius: int) -> List[Hex]:
+        return [center.add(dq, dr) for dq, dr in HexTraversal.ring_offsets(radius)]
 
     @staticmethod
     def spiral(center: Hex, radius: int) -> List[Hex]:
         """All hexes from ring 0..radius in order (center first)."""
-        out: List[Hex] = []
-        for r in range(0, radius + 1):
-            out.extend(HexTraversal.ring(center, r))
-        return out
+        return [center.add(dq, dr) for dq, dr in HexTraversal.spiral_offsets(radius)]